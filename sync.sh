@@ -3,23 +3,29 @@
 # KEEPS ORIGINAL FILENAMES - NO RENAMING
 # SYNCS TO USER-LEVEL ONLY (~/.claude/agents/) - NOT PROJECT-LEVEL
 
+# Resolve the target directory once instead of expanding ~ for every agent
+AGENTS_DIR="$HOME/.claude/agents"
+
 echo "🔄 Syncing agents to USER-LEVEL directory"
 echo "   Location: ~/.claude/agents/"
 echo "   Scope: Available across ALL projects"
 echo "======================================"
 
 # Check if Claude Code agents directory exists
-if [ ! -d ~/.claude/agents ]; then
+if [ ! -d "$AGENTS_DIR" ]; then
     echo "❌ Error: ~/.claude/agents directory does not exist!"
     echo "   Please ensure Claude Code is properly installed first."
     exit 1
 fi
 
 # Clean old files
-rm -f ~/.claude/agents/*.md 2>/dev/null
+rm -f "$AGENTS_DIR"/*.md 2>/dev/null
 
 echo "📤 Copying agents with original names..."
 
+# Count agents as they are written rather than listing the directory afterwards
+synced=0
+
 # Simple function to add YAML and copy - KEEPS ORIGINAL NAME
 sync_agent() {
     local filename="$1"
@@ -28,10 +34,11 @@ sync_agent() {
     
     if [ -f "$filename" ]; then
         # Extract the "You are" line from the ## Role section
-        role_line=$(grep -A 1 "^## Role" "$filename" | tail -1)
+        # (stop reading at the role line instead of scanning the whole file)
+        role_line=$(awk '/^## Role/ { getline; print; exit }' "$filename")
         
-        # Create the properly formatted agent file
-        (
+        # Create the properly formatted agent file (brace group, no subshell fork)
+        {
             echo "---"
             echo "name: $basename"
             echo "description: $description"
@@ -42,7 +49,9 @@ sync_agent() {
             echo ""
             # Skip the first few lines (title and role section) and output the rest
             awk '/^## Core Expertise/,EOF' "$filename"
-        ) > ~/.claude/agents/$filename
+        } > "$AGENTS_DIR/$filename" || return 1
+        # Only count (and tick) agents whose file was actually written
+        synced=$((synced + 1))
         echo "   ✓ $basename - $description"
     fi
 }
@@ -67,4 +76,4 @@ sync_agent webrtc-expert-system.md "MUST BE USED for WebRTC and real-time commun
 
 echo ""
 echo "✅ Done! Agents synced to ~/.claude/agents/"
-echo "Total: $(ls -1 ~/.claude/agents/*.md 2>/dev/null | wc -l) agents"
+echo "Total: $synced agents"